@@ -105,6 +105,49 @@ user2 = create_user("JohnCena", None, "WWE")
 if user2:
     print(user2)
 
+
+# ==============================================================================
+# MANUAL VALIDATION — REPORTING ALL ERRORS
+# ==============================================================================
+
+def create_user_all_errors(username, email, age):
+    """
+    Same checks as `create_user`, but every error is collected first.
+
+    - No try/except needed on the success path
+    - All problems are reported in one pass
+    - Still has to be written (and kept in sync) by hand for every field
+    """
+    errors = []
+
+    if not isinstance(username, str):
+        errors.append(f"Username {username} must be a string")
+
+    if not isinstance(email, str):
+        errors.append(f"Email {email} must be a string")
+
+    if not isinstance(age, int):
+        errors.append(f"Age {age} must be an integer")
+
+    if errors:
+        print("Errors:", "; ".join(errors))
+        return None
+
+    user_context = {
+        "Username": username,
+        "Email": email,
+        "Age": age,
+    }
+
+    return f"User {user_context} created successfully!"
+
+
+user3 = create_user_all_errors("JohnCena", None, "WWE")
+if user3:
+    print(user3)
+
+# Errors: Email None must be a string; Age WWE must be an integer
+
 """
 --------------------------------------------------------------------------------
 PROBLEMS WITH THE MANUAL APPROACH
@@ -113,6 +156,8 @@ PROBLEMS WITH THE MANUAL APPROACH
 1. Multiple validation errors exist in `user2`, but only ONE is reported.
 2. You must fix errors one-by-one and rerun the program repeatedly.
 3. Validation code quickly becomes cluttered and hard to read.
+   Reporting ALL errors (`create_user_all_errors`) means even more
+   hand-written bookkeeping for every field.
 4. Scaling this approach to:
    - Lists
    - Dictionaries
@@ -7,35 +7,16 @@ Goal:
 - Show how to access fields from a validated Pydantic model
 - Demonstrate default mutability behavior
 - Highlight that reassignment does NOT trigger re-validation by default
+- Show how to opt in to immutability with `frozen=True`
+- Show how to rebuild a model from already-trusted data with `model_construct`
 
 Key point:
 Pydantic validates data at model creation, not on every attribute assignment.
 """
 
-from datetime import datetime
-
-from pydantic import BaseModel, ValidationError
-
-# ==============================================================================
-# SCHEMA DEFINITION
-# ==============================================================================
-
-class User(BaseModel):
-    """
-    User schema.
-    """
-
-    uid: int
-    username: str
-    email: str
-    age: int
-
-    bio: str = ""
-    is_active: bool = True
-
-    fullname: str | None = None
-    createdAt: datetime | None = None
+from pydantic import ConfigDict, ValidationError
 
+from _models import User  # same schema as 04_default_optional_values.py
 
 # ==============================================================================
 # MODEL CREATION, ACCESS, AND MUTATION
@@ -71,6 +52,74 @@ except ValidationError as e:
     print(e)
 
 
+# ==============================================================================
+# OPTING IN TO IMMUTABILITY (frozen=True)
+# ==============================================================================
+
+"""
+If instances should never change after creation, freeze the model.
+
+Any assignment then raises a ValidationError instead of silently
+storing a wrong value.
+
+Note:
+- `frozen=True` does NOT make instances smaller
+- BaseModel instances always keep their fields in `__dict__`
+  (`slots` is only available for dataclasses)
+"""
+
+class FrozenUser(User):
+    model_config = ConfigDict(frozen=True)
+
+
+try:
+    frozen_user = FrozenUser(
+        uid=101,
+        username="jamesbond007",
+        email="jamesbond@007.com",
+        age=40,
+    )
+    frozen_user.bio = 123    # not allowed
+
+except ValidationError as e:
+    print("Validation Error (frozen model):")
+    print(e)
+    # 1 validation error for FrozenUser
+    # bio
+    #   Instance is frozen [type=frozen_instance, ...]
+
+
+# ==============================================================================
+# REBUILDING FROM TRUSTED DATA (model_construct)
+# ==============================================================================
+
+"""
+When data has ALREADY been validated once (e.g. a row we stored ourselves),
+running the validator again is redundant.
+
+`model_construct()` skips validation entirely and fills the fields directly.
+Defaults are still applied for missing fields.
+
+(It is not automatically faster — see 16_validating_many_records.py.)
+"""
+
+trusted_data = {
+    "uid": 102,
+    "username": "alecTrevelyan006",
+    "email": "alec@006.com",
+    "age": 38,
+}
+
+trusted_user = User.from_trusted(trusted_data)
+print(trusted_user)
+# uid=102 username='alecTrevelyan006' email='alec@006.com'
+# age=38 bio='' is_active=True fullname=None createdAt=None
+
+# Reassignment behaves exactly as before — no validation either way
+trusted_user.bio = "Former 00 agent"
+print(trusted_user.bio)    # Former 00 agent
+
+
 """
 --------------------------------------------------------------------------------
 KEY TAKEAWAYS
@@ -78,8 +127,10 @@ KEY TAKEAWAYS
 
 - Model fields are accessed via dot notation
 - Models are mutable by default
+- `frozen=True` makes any reassignment raise a ValidationError
 - Attribute reassignment does NOT re-validate types
 - Validation happens only at instantiation
+- `model_construct()` skips validation — use it ONLY for trusted data
 
 This behavior is intentional and important to understand when
 using Pydantic models in long-lived objects or stateful systems.
@@ -7,36 +7,18 @@ This example demonstrates how to:
 - Create a validated Pydantic model
 - Convert the model into a Python dictionary
 - Serialize the model into JSON
+- Produce a JSON-safe dict for other JSON libraries
 
 Key concept:
 Pydantic models provide built-in serialization methods that make it easy
 to move between Python objects and JSON-compatible representations.
 """
 
-from datetime import datetime
+from datetime import UTC, datetime
 
-from pydantic import BaseModel, ValidationError
-
-# ==============================================================================
-# SCHEMA DEFINITION
-# ==============================================================================
-
-class User(BaseModel):
-    """
-    User schema.
-    """
-
-    uid: int
-    username: str
-    email: str
-    age: int
-
-    bio: str = ""
-    is_active: bool = True
-
-    fullname: str | None = None
-    createdAt: datetime | None = None
+from pydantic import ValidationError
 
+from _models import User  # same schema as 04_default_optional_values.py
 
 # ==============================================================================
 # MODEL CREATION & SERIALIZATION
@@ -78,6 +60,8 @@ try:
     # CONVERT MODEL TO JSON (COMPACT)
     # --------------------------------------------------------------------------
     # model_dump_json() returns a JSON string
+    # It is written directly by pydantic-core (Rust): no intermediate dict,
+    # so it is faster than json.dumps(user.model_dump())
     print(user.model_dump_json())
     # {"uid":101,"username":"jamesbond007","email":"jamesbond@007.com",
     #  "age":40,"bio":"","is_active":true,"fullname":null,"createdAt":null}
@@ -98,6 +82,20 @@ try:
     #   "createdAt": null
     # }
 
+    # --------------------------------------------------------------------------
+    # CONVERT MODEL TO A JSON-SAFE DICTIONARY
+    # --------------------------------------------------------------------------
+    # model_dump() keeps Python objects (datetime, UUID, ...) as they are.
+    # model_dump(mode="json") converts them to JSON-compatible values, which is
+    # what another JSON library (orjson, msgspec, json) expects as input.
+    stamped_user = user.model_copy(
+        update={"createdAt": datetime(2024, 1, 1, 9, 30, tzinfo=UTC)}
+    )
+    print(stamped_user.model_dump()["createdAt"])
+    # 2024-01-01 09:30:00+00:00   (a datetime object)
+    print(stamped_user.model_dump(mode="json")["createdAt"])
+    # 2024-01-01T09:30:00Z        (a plain string)
+
 except ValidationError as e:
     print("Validation Error:")
     print(e)
@@ -110,7 +108,9 @@ Key Takeaways
 
 - model_dump() converts a Pydantic model into a Python dict
 - model_dump_json() converts the model into a JSON string
+  (serialized in Rust — prefer it over json.dumps(model_dump()))
 - JSON output can be formatted using indentation
+- model_dump(mode="json") returns a dict ready for any JSON library
 - Serialization preserves validated data and types
 
 These methods are commonly used when:
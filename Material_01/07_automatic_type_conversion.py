@@ -16,30 +16,9 @@ This is intentional and helps when dealing with real-world input
 (e.g., JSON, environment variables, form data).
 """
 
-from datetime import datetime
-
-from pydantic import BaseModel, ValidationError
-
-# ==============================================================================
-# SCHEMA DEFINITION
-# ==============================================================================
-
-class User(BaseModel):
-    """
-    User schema demonstrating type coercion.
-    """
-
-    uid: int
-    username: str
-    email: str
-    age: int
-
-    bio: str = ""
-    is_active: bool = True
-
-    fullname: str | None = None
-    createdAt: datetime | None = None
+from pydantic import ValidationError
 
+from _models import User  # same schema as 04_default_optional_values.py
 
 # ==============================================================================
 # TYPE COERCION IN ACTION
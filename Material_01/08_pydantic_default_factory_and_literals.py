@@ -15,7 +15,6 @@ These patterns are essential for writing *correct, bug-free schemas*.
 """
 
 from datetime import UTC, datetime
-from functools import partial
 from typing import List, Literal
 
 from pydantic import BaseModel, Field, ValidationError
@@ -58,13 +57,21 @@ class BlogPost(BaseModel):
     Why?
     - Lists are mutable
     - The same list would be shared across all instances
+
+    ALTERNATIVE (when tags never change after creation):
+        tags: tuple[str, ...] = ()
+
+    Why is this safe?
+    - Tuples are immutable, so sharing one empty tuple is harmless
+    - No new object is allocated per instance
+    - Lists passed as input are still accepted (converted to tuple)
     """
 
     # ---------------------------
     # RUNTIME DATETIME DEFAULT
     # ---------------------------
     createAt: datetime = Field(
-        default_factory=partial(datetime.now, tz=UTC)
+        default_factory=lambda: datetime.now(UTC)
     )
 
     """
@@ -74,6 +81,16 @@ class BlogPost(BaseModel):
     Why?
     - Executed once at class definition time
     - Every instance would get the SAME timestamp
+
+    Why a lambda?
+    - `default_factory` takes a zero-argument callable
+    - `partial(datetime.now, tz=UTC)` works too, but the lambda
+      passes UTC positionally and skips partial's keyword handling
+
+    Performance note:
+    - `datetime.now(UTC)` is a single call implemented in C
+    - Hand-rolled clocks (e.g. `time.time_ns()` + `datetime.fromtimestamp`)
+      do MORE work in Python and are slower, not faster
     """
 
     # ---------------------------
@@ -81,18 +98,46 @@ class BlogPost(BaseModel):
     # ---------------------------
     status: Literal["draft", "publish", "archive"] = "draft"
 
+    """
+    Literal vs Enum:
+    - pydantic-core checks a Literal with a single lookup in Rust,
+      so it is already as fast as an IntEnum
+    - Prefer an Enum only when the allowed values must be reused
+      elsewhere in your code (e.g. `class Status(str, Enum)`)
+    """
+
+    @classmethod
+    def from_trusted(cls, data: dict) -> "BlogPost":
+        """
+        Build a BlogPost WITHOUT running validation.
+
+        Precondition:
+        - `data` must already be valid (e.g. loaded from our own storage)
+
+        `default_factory` fields (tags, createAt) are still filled in.
+        """
+        return cls.model_construct(**data)
+
 
 # ==============================================================================
 # MODEL CREATION
 # ==============================================================================
 
+post_data = {
+    "bpid": 201,
+    "title": "Writing my first post",
+    "content": "This is nothing in this post",
+    "author_id": 101,
+}
+
+# Set to True ONLY when post_data comes from a trusted, already-validated source
+already_validated = False
+
 try:
-    blog_post = BlogPost(
-        bpid=201,
-        title="Writing my first post",
-        content="This is nothing in this post",
-        author_id=101,
-    )
+    if already_validated:
+        blog_post = BlogPost.from_trusted(post_data)   # no validation
+    else:
+        blog_post = BlogPost(**post_data)              # full validation
 
     print(blog_post)
 
@@ -117,7 +162,10 @@ KEY TAKEAWAYS
 3. `Literal` enforces strict allowed values
    - Anything outside the defined set raises an error
 
-4. `partial()` is a clean way to pass arguments to factory functions
+4. Wrap factories that need arguments in a lambda (or `partial()`)
+
+5. `model_construct()` skips validation but still runs `default_factory`
+   - Only use it for data you already trust
 
 These rules prevent subtle bugs that are very hard to detect later.
 ================================================================================
@@ -9,13 +9,14 @@ This example demonstrates:
 2. How Pydantic validates values at runtime
 3. Combining constraints with defaults, mutable fields, and literals
 4. Patterns for strings (regex) using `pattern`
+5. Validating plain dicts with `TypedDict` + `TypeAdapter` (no model instance)
 """
 
 from datetime import UTC, datetime
-from functools import partial
 from typing import Annotated, List, Literal
 
-from pydantic import BaseModel, Field, ValidationError
+from pydantic import BaseModel, Field, TypeAdapter, ValidationError
+from typing_extensions import TypedDict
 
 # ==============================================================================
 # USER MODEL WITH CONSTRAINTS
@@ -67,7 +68,7 @@ class BlogPost(BaseModel):
     tags: List[str] = Field(default_factory=list)
 
     # Runtime datetime
-    createAt: datetime = Field(default_factory=partial(datetime.now, tz=UTC))
+    createAt: datetime = Field(default_factory=lambda: datetime.now(UTC))
 
     # Restrict status values
     status: Literal["draft", "publish", "archive"] = "draft"
@@ -118,6 +119,49 @@ except ValidationError as e:
     print(e)
 
 
+# ==============================================================================
+# VALIDATING PLAIN DICTS (TypedDict + TypeAdapter)
+# ==============================================================================
+
+"""
+Sometimes you only need *validated data*, not a model object
+(e.g. the result is passed straight on as a dict).
+
+The same `Annotated` constraints work on a `TypedDict`.
+`TypeAdapter` builds the validator once; every call returns a plain dict,
+so no model instance is created.
+
+Note:
+- Pydantic requires `typing_extensions.TypedDict` on Python < 3.12
+"""
+
+class UserDict(TypedDict):
+    uid: Annotated[int, Field(ge=0)]
+    username: Annotated[str, Field(min_length=3, max_length=20)]
+    email: str
+    age: Annotated[int, Field(ge=18, le=60)]
+
+
+# Build once at module level, reuse for every validation
+user_dict_adapter = TypeAdapter(UserDict)
+
+try:
+    user_dict = user_dict_adapter.validate_python(
+        {
+            "uid": "102",              # coerced to int, just like BaseModel
+            "username": "alec006",
+            "email": "alec@006.com",
+            "age": 38,
+        }
+    )
+    print(user_dict)
+    # {'uid': 102, 'username': 'alec006', 'email': 'alec@006.com', 'age': 38}
+
+except ValidationError as e:
+    print("Validation Error:")
+    print(e)
+
+
 """
 --------------------------------------------------------------------------------
 KEY TAKEAWAYS
@@ -139,5 +183,8 @@ KEY TAKEAWAYS
 
 4. Provides robust, declarative, and maintainable validation logic
    without writing any manual checks.
+
+5. `TypedDict` + `TypeAdapter` applies the same rules to plain dicts
+   when no model object is needed.
 ================================================================================
 """
@@ -60,6 +60,8 @@ class User(BaseModel):
     username: Annotated[str, Field(min_length=3, max_length=20)]
 
     # Strict email validation
+    # (runs the pure-Python `email-validator` package — by far the most
+    #  expensive check in this model, roughly 100x a plain `str` field)
     email: EmailStr
 
     # Optional website, validated only if provided
@@ -136,6 +138,8 @@ KEY TAKEAWAYS
 
 - UUIDs should be generated with `default_factory`, not manually assigned
 - Purpose-built types (EmailStr, HttpUrl, SecretStr) prevent entire classes of bugs
+- EmailStr is thorough but comparatively slow — validate emails once, at the
+  boundary, instead of re-validating the same data over and over
 - `Annotated + Field` keeps validation rules declarative and readable
 - Sensitive data is protected by default
 - Validation occurs only at model creation — invalid data never leaks in
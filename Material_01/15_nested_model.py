@@ -26,9 +26,7 @@ Instead, you must:
 ================================================================================
 """
 
-import json
 from datetime import UTC, datetime
-from functools import partial
 from typing import Annotated, List, Literal
 from uuid import UUID, uuid4
 
@@ -55,6 +53,7 @@ class User(BaseModel):
         extra="allow",
         validate_assignment=True,
         frozen=True,              # IMMUTABLE
+        revalidate_instances="never",  # (default) reuse User instances as-is
     )
 
     uid: UUID = Field(alias="id", default_factory=uuid4)
@@ -132,12 +131,35 @@ class BlogPost(BaseModel):
     view_count: int = 0
     is_published: bool = False
     tags: list[str] = Field(default_factory=list)
-    create_at: datetime = Field(default_factory=partial(datetime.now, tz=UTC))
+    create_at: datetime = Field(default_factory=lambda: datetime.now(UTC))
     status: Literal["draft", "published", "archived"] = "draft"
     slug: Annotated[str, Field(pattern=r"^[a-z0-9-]+$")]
 
     comments: List[Comment] = Field(default_factory=list)
 
+    @classmethod
+    def from_trusted(cls, data: dict) -> "BlogPost":
+        """
+        Rebuild a BlogPost (and its nested models) WITHOUT validation.
+
+        `model_construct()` does not recurse, so the nested `author` and
+        `comments` dicts are turned into model instances here.
+
+        Precondition:
+        - `data` comes from `model_dump(round_trip=True)` of a validated post,
+          so every value already has its final type (UUID, SecretStr, HttpUrl)
+        """
+        return cls.model_construct(
+            **{
+                **data,
+                "author": User.model_construct(**data["author"]),
+                "comments": [
+                    Comment.model_construct(**comment)
+                    for comment in data.get("comments", [])
+                ],
+            }
+        )
+
 
 # ==============================================================================
 # CREATE BLOG POST (WITH NEW VALUES)
@@ -148,7 +170,7 @@ post_data = {
     "content": "Pydantic v2 introduces computed fields, validators, and immutability.",
     "slug": "deep-dive-pydantic-v2",
     "author": {
-        "id": "a1f8b7c1-9d77-4c9a-8c2c-7c2f01aa9999",
+        "id": UUID("a1f8b7c1-9d77-4c9a-8c2c-7c2f01aa9999"),
         "username": "jamesbond007",
         "email": "jamesbond@007.com",
         "password": "UltraSecret!",
@@ -156,7 +178,7 @@ post_data = {
         "first_name": "James",
         "last_name": "Bond",
         "follower_count": 25000,
-        "website": "jamesbond.007",
+        "website": "jamesbond007.com",
     },
     "comments": [
         {
@@ -172,18 +194,39 @@ post_data = {
     ],
 }
 
+# Untrusted input → full validation
 post = BlogPost.model_validate(post_data)
 
 print("BLOG POST:")
 print(post.model_dump_json(indent=2))
 
 
+# ==============================================================================
+# REBUILD BLOG POST FROM TRUSTED DATA (NO VALIDATION)
+# ==============================================================================
+
+"""
+Imagine `stored_post` was saved by our own service after validation.
+Loading it back does not need another full validation pass
+(`EmailStr` in particular is expensive).
+
+- `round_trip=True` leaves out computed fields, so the dump can be loaded back
+- Computed fields still work: they are properties, evaluated on access
+"""
+
+stored_post = post.model_dump(round_trip=True)
+restored_post = BlogPost.from_trusted(stored_post)
+
+print("\nRESTORED AUTHOR:", restored_post.author.display_name)          # James Bond
+print("SAME JSON:", restored_post.model_dump_json() == post.model_dump_json())  # True
+
+
 # ==============================================================================
 # CREATE USER (WITH NEW VALUES)
 # ==============================================================================
 
 user_data = {
-    "id": "7b2a9a5d-6e6b-4db6-92c9-8c71c2e4abcd",
+    "id": UUID("7b2a9a5d-6e6b-4db6-92c9-8c71c2e4abcd"),
     "username": "Python_Master",
     "email": "pythonmaster@example.com",
     "password": "MasterKey123",
@@ -194,12 +237,38 @@ user_data = {
     "notes": "Loves clean architecture",
 }
 
-user = User.model_validate_json(json.dumps(user_data))
+# Data is already a Python dict → validate it directly.
+# (Converting it to a JSON string first only to parse it again is wasted work.
+#  Use `model_validate_json()` when the input really arrives as JSON bytes —
+#  with strict=True, JSON input may then carry the id as a plain string.)
+user = User.model_validate(user_data)
 
 print("\nUSER:")
 print(user.model_dump_json(indent=2))
 
 
+# ==============================================================================
+# REUSING A VALIDATED USER (NO RE-VALIDATION)
+# ==============================================================================
+
+"""
+`user` is already a validated User instance.
+
+With `revalidate_instances="never"` (Pydantic's default), passing it into
+another model stores the SAME object — its fields are not validated again.
+This keeps composing nested models cheap.
+"""
+
+second_post = BlogPost(
+    title="Frozen Models in Practice",
+    content="Reusing validated objects keeps nested models cheap.",
+    slug="frozen-models-in-practice",
+    author=user,
+)
+
+print("\nSAME AUTHOR OBJECT REUSED:", second_post.author is user)   # True
+
+
 # ==============================================================================
 # IMMUTABILITY DEMO (CORRECT WAY)
 # ==============================================================================
@@ -221,10 +290,13 @@ KEY TAKEAWAYS
 
 1. `frozen=True` makes models IMMUTABLE (production-safe)
 2. Nested models validate recursively
+   (existing model instances are reused, not re-validated)
 3. Aliases (`id -> uid`) work seamlessly
 4. Computed fields are serialized automatically
 5. Updates require `model_copy(update=...)`
-6. This pattern is ideal for:
+6. Trusted, already-validated data can skip validation via `model_construct()`
+   (nested models must be constructed explicitly)
+7. This pattern is ideal for:
    - Event-driven systems
    - Audit-safe data
    - CQRS / DDD architectures
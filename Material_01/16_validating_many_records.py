@@ -0,0 +1,197 @@
+"""
+================================================================================
+PYDANTIC — VALIDATING MANY RECORDS EFFICIENTLY
+================================================================================
+
+Real systems rarely validate a single object.
+API payloads, CSV imports and database exports contain THOUSANDS of rows.
+
+This example compares ways of turning a list of dicts into `User` objects:
+
+1. Calling the model for every row:        User(**row)
+2. Reusing the model's compiled validator:  validate_user(row)
+3. Validating the whole list in one call:   user_list_adapter.validate_python(rows)
+4. Skipping validation for TRUSTED rows:    User.from_trusted(row)
+
+Key idea:
+Pydantic compiles each model into a validator ONCE (in Rust, pydantic-core).
+The less Python work we do around that validator per row, the faster
+bulk validation becomes.
+"""
+
+from timeit import timeit
+
+from pydantic import ValidationError
+
+from _models import User, user_list_adapter  # User schema from lesson 04
+
+# ==============================================================================
+# SAMPLE DATA
+# ==============================================================================
+
+# Dict keys written in source code are interned by Python automatically,
+# and pydantic-core matches field names itself — wrapping keys in
+# `sys.intern()` makes no measurable difference.
+rows = [
+    {
+        "uid": i,
+        "username": f"agent{i:03d}",
+        "email": f"agent{i}@mi6.gov",
+        "age": 30,
+    }
+    for i in range(10_000)
+]
+
+
+# ==============================================================================
+# APPROACH 1: ONE MODEL CALL PER ROW
+# ==============================================================================
+
+"""
+The most readable version.
+
+For every row Python has to:
+- Unpack the dict into keyword arguments
+- Enter BaseModel.__init__
+- Look up the model's validator and call it
+"""
+
+users = [User(**row) for row in rows]
+print(users[0])
+# uid=0 username='agent000' email='agent0@mi6.gov' age=30 bio='' is_active=True fullname=None createdAt=None
+
+
+# ==============================================================================
+# APPROACH 2: REUSE THE COMPILED VALIDATOR
+# ==============================================================================
+
+"""
+Every model carries its compiled validator as `__pydantic_validator__`
+(this is what `User.model_validate()` calls internally).
+
+Binding `validate_python` to a local name ONCE:
+- Skips keyword-argument unpacking
+- Skips BaseModel.__init__
+- Skips the attribute lookup on every row
+
+The result is exactly the same: fully validated `User` instances.
+"""
+
+validate_user = User.__pydantic_validator__.validate_python
+
+users = [validate_user(row) for row in rows]
+print(users[0])
+# uid=0 username='agent000' email='agent0@mi6.gov' age=30 bio='' is_active=True fullname=None createdAt=None
+
+# Serialization has a compiled counterpart too (returns JSON bytes)
+print(User.__pydantic_serializer__.to_json(users[0]))
+# b'{"uid":0,"username":"agent000","email":"agent0@mi6.gov","age":30,...}'
+
+
+# ==============================================================================
+# APPROACH 3: VALIDATE THE WHOLE LIST IN ONE CALL (TypeAdapter)
+# ==============================================================================
+
+"""
+`TypeAdapter(list[User])` compiles a validator for the LIST itself.
+
+One call hands the entire list to pydantic-core:
+- The loop over rows runs in Rust, not Python
+- Errors report the failing row index (e.g. `3.age`)
+
+The adapter is built once in `_models.py` — building it is the expensive
+part, so never create a TypeAdapter inside a loop or per request.
+"""
+
+users = user_list_adapter.validate_python(rows)
+print(len(users), type(users[0]).__name__)    # 10000 User
+
+# The same adapter serializes the whole list straight to JSON bytes
+print(user_list_adapter.dump_json(users[:2]))
+# b'[{"uid":0,"username":"agent000",...},{"uid":1,"username":"agent001",...}]'
+
+
+# ==============================================================================
+# APPROACH 4: TRUSTED ROWS — SKIP VALIDATION ENTIRELY
+# ==============================================================================
+
+"""
+If the rows were validated before (e.g. we wrote them to our own database),
+`User.from_trusted()` (a thin wrapper around `model_construct()`) only fills
+the fields — no checks, no coercion.
+
+Surprise: for a simple model like this one it is SLOWER than validating!
+- `model_construct()` runs in Python
+- The validator for plain str/int fields runs in Rust and is very cheap
+
+It only pays off when validation itself is expensive
+(e.g. `EmailStr`, custom `field_validator`s, large nested models).
+
+Do NOT write your own `__init__` to "speed up" a model: it bypasses
+pydantic-core and silently drops coercion and error reporting.
+`model_construct()` is the supported way to skip validation.
+"""
+
+trusted_users = [User.from_trusted(row) for row in rows]
+print(trusted_users[0])
+# uid=0 username='agent000' email='agent0@mi6.gov' age=30 bio='' is_active=True fullname=None createdAt=None
+
+
+# ==============================================================================
+# INVALID ROWS STILL FAIL
+# ==============================================================================
+
+try:
+    validate_user({"uid": "not-a-number", "username": "bad", "email": "x", "age": 1})
+
+except ValidationError as e:
+    print("Validation Error:")
+    print(e)
+
+try:
+    user_list_adapter.validate_python(rows[:2] + [{"uid": 2, "username": "x"}])
+
+except ValidationError as e:
+    print("Validation Error (list):")
+    print(e)
+    # 2 validation errors for list[User]
+    # 2.email
+    #   Field required ...
+    # 2.age
+    #   Field required ...
+
+
+# ==============================================================================
+# TIMING COMPARISON
+# ==============================================================================
+
+time_model_call = timeit(lambda: [User(**row) for row in rows], number=5)
+time_validator = timeit(lambda: [validate_user(row) for row in rows], number=5)
+time_adapter = timeit(lambda: user_list_adapter.validate_python(rows), number=5)
+time_trusted = timeit(lambda: [User.from_trusted(row) for row in rows], number=5)
+
+print(f"User(**row):          {time_model_call:.3f}s")
+print(f"validate_user(row):   {time_validator:.3f}s")
+print(f"list adapter:         {time_adapter:.3f}s")
+print(f"User.from_trusted():  {time_trusted:.3f}s   (no validation, yet slower here)")
+
+
+"""
+--------------------------------------------------------------------------------
+KEY TAKEAWAYS
+--------------------------------------------------------------------------------
+
+1. Each model is compiled into a validator once, at class creation
+2. `User(**row)` adds Python overhead around that validator on every row
+3. Binding `User.__pydantic_validator__.validate_python` once removes
+   most of that overhead — results are identical
+4. `TypeAdapter(list[User])` validates the whole list in ONE call —
+   build it once at module level and reuse it
+5. Validation rules are NOT skipped — invalid rows still raise errors
+6. `model_construct()` skips validation completely — trusted data only
+   (and it is only faster when the skipped validation is expensive)
+
+Start with the readable `User(**row)`.
+Measure before reaching for any of the alternatives.
+================================================================================
+"""
@@ -0,0 +1,189 @@
+"""
+================================================================================
+PYDANTIC — DATACLASSES (VALIDATION WITHOUT BaseModel)
+================================================================================
+
+Not every schema needs the full `BaseModel` feature set.
+
+When you only need:
+- Validated input
+- A small, lightweight object afterwards
+
+`pydantic.dataclasses.dataclass` is a good fit.
+
+It is a standard Python dataclass with Pydantic validation attached:
+- Same type hints, same validation rules, same ValidationError
+- Supports `slots=True` (no per-instance `__dict__`) and `frozen=True`
+- Instances are noticeably smaller than BaseModel instances
+
+What you give up:
+- No `model_dump()` / `model_dump_json()` methods on the instance
+  (use `dataclasses.asdict()` or a `TypeAdapter` instead)
+- No `model_construct()`, `model_copy()` or other BaseModel helpers
+
+Rule of thumb:
+- BaseModel → APIs, serialization, rich configuration
+- Pydantic dataclass → validated internal data with a small footprint
+- Plain dataclass → data that was ALREADY validated at the boundary
+"""
+
+import dataclasses
+import sys
+from datetime import datetime
+
+from pydantic import TypeAdapter, ValidationError
+from pydantic.dataclasses import dataclass
+
+from _models import User as UserModel  # BaseModel version, for comparison
+
+# ==============================================================================
+# SCHEMA DEFINITION
+# ==============================================================================
+
+@dataclass(slots=True, frozen=True)
+class User:
+    """
+    Same fields as the BaseModel `User` from lesson 04.
+
+    - slots=True  → fields live in fixed slots, no `__dict__`
+    - frozen=True → instances cannot be modified after creation
+    """
+
+    uid: int
+    username: str
+    email: str
+    age: int
+
+    bio: str = ""
+    is_active: bool = True
+
+    fullname: str | None = None
+    createdAt: datetime | None = None
+
+
+# ==============================================================================
+# VALIDATION WORKS EXACTLY AS WITH BaseModel
+# ==============================================================================
+
+try:
+    user = User(
+        uid="101",                 # coerced to int
+        username="jamesbond007",
+        email="jamesbond@007.com",
+        age=40,
+    )
+    print(user)
+    # User(uid=101, username='jamesbond007', email='jamesbond@007.com',
+    #      age=40, bio='', is_active=True, fullname=None, createdAt=None)
+
+except ValidationError as e:
+    print("Validation Error:")
+    print(e)
+
+try:
+    User(uid="abc", username="jamesbond007", email=None, age=40)
+
+except ValidationError as e:
+    print("Validation Error:")
+    print(e)
+    # 2 validation errors for User
+    # uid
+    #   Input should be a valid integer ...
+    # email
+    #   Input should be a valid string ...
+
+
+# ==============================================================================
+# FROZEN: NO MUTATION
+# ==============================================================================
+
+try:
+    user.bio = 123
+
+except dataclasses.FrozenInstanceError as e:
+    print("Frozen dataclass:", e)
+    # Frozen dataclass: cannot assign to field 'bio'
+
+
+# ==============================================================================
+# SERIALIZATION
+# ==============================================================================
+
+# Plain dict (standard library)
+print(dataclasses.asdict(user))
+
+# JSON via a TypeAdapter (built once, reused)
+user_adapter = TypeAdapter(User)
+print(user_adapter.dump_json(user))
+# b'{"uid":101,"username":"jamesbond007",...,"createdAt":null}'
+
+
+# ==============================================================================
+# MEMORY FOOTPRINT
+# ==============================================================================
+
+model_user = UserModel(
+    uid=101,
+    username="jamesbond007",
+    email="jamesbond@007.com",
+    age=40,
+)
+
+print("Has __dict__ (dataclass):", hasattr(user, "__dict__"))     # False
+print("dataclass instance bytes:", sys.getsizeof(user))            # ~96
+print(
+    "BaseModel instance bytes:",
+    sys.getsizeof(model_user) + sys.getsizeof(model_user.__dict__),  # ~350
+)
+
+
+# ==============================================================================
+# VALIDATE AT THE BOUNDARY, CARRY A PLAIN DATACLASS INSIDE
+# ==============================================================================
+
+"""
+A common production pattern:
+- A BaseModel validates data where it ENTERS the system (API, file, queue)
+- Internally, the validated values travel in a plain, slotted dataclass
+
+The internal type has no validation cost and no Pydantic machinery at all.
+"""
+
+@dataclasses.dataclass(slots=True, frozen=True)
+class UserRecord:
+    uid: int
+    username: str
+    email: str
+    age: int
+
+
+def to_record(validated: UserModel) -> UserRecord:
+    """Copy a validated BaseModel into the internal, plain dataclass."""
+    return UserRecord(
+        uid=validated.uid,
+        username=validated.username,
+        email=validated.email,
+        age=validated.age,
+    )
+
+
+record = to_record(model_user)
+print(record)
+# UserRecord(uid=101, username='jamesbond007', email='jamesbond@007.com', age=40)
+
+
+"""
+--------------------------------------------------------------------------------
+KEY TAKEAWAYS
+--------------------------------------------------------------------------------
+
+1. `pydantic.dataclasses.dataclass` validates just like BaseModel
+2. `slots=True` removes the per-instance `__dict__` → smaller objects
+3. `frozen=True` blocks mutation (raises `FrozenInstanceError`)
+4. Serialize with `dataclasses.asdict()` or a `TypeAdapter`
+5. Use BaseModel when you need its API (model_dump, model_config, ...)
+6. Validate once at the boundary, then pass plain dataclasses around
+
+Pick the lightest tool that still gives you validated data.
+================================================================================
+"""
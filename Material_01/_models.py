@@ -0,0 +1,67 @@
+"""
+================================================================================
+SHARED SCHEMAS
+================================================================================
+
+The `User` schema introduced in `04_default_optional_values.py` is reused
+unchanged by lessons 05, 06, 07, 16 and 17.
+
+Defining it once here means:
+- Every lesson works with exactly the same schema
+- Pydantic builds the validator for it only once per interpreter
+
+Usage (from any script in this folder):
+
+    from _models import User, user_list_adapter
+"""
+
+from datetime import datetime
+
+from pydantic import BaseModel, ConfigDict, TypeAdapter
+
+# ==============================================================================
+# USER SCHEMA
+# ==============================================================================
+
+class User(BaseModel):
+    """
+    User schema.
+
+    - Required: uid, username, email, age
+    - Defaults: bio, is_active
+    - Optional (nullable): fullname, createdAt
+    """
+
+    uid: int
+    username: str
+    email: str
+    age: int
+
+    bio: str = ""
+    is_active: bool = True
+
+    fullname: str | None = None
+    createdAt: datetime | None = None
+
+    @classmethod
+    def from_trusted(cls, data: dict) -> "User":
+        """
+        Build a User WITHOUT running validation.
+
+        Precondition:
+        - `data` must already be valid (e.g. produced by `model_dump()`
+          of a validated User, or read back from our own database)
+
+        Never use this for external input — nothing is checked or coerced.
+        """
+        return cls.model_construct(**data)
+
+
+# ==============================================================================
+# LIST-OF-USERS ADAPTER
+# ==============================================================================
+
+# Validates / serializes a whole `list[User]` in a single call into
+# pydantic-core. Created once here and reused everywhere.
+# `defer_build=True`: only lessons that actually use it pay to build it.
+user_list_adapter = TypeAdapter(list[User], config=ConfigDict(defer_build=True))
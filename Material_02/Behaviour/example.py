@@ -50,6 +50,12 @@ class User(BaseModel):
 
         Runs automatically whenever `username` is set.
         Raises an error if the length is less than 4.
+
+        Note:
+        A plain length rule can also be declared without Python code:
+            username: str = Field(min_length=4)
+        pydantic-core then checks it in Rust, with no Python call.
+        Keep custom validators for rules that constraints cannot express.
         """
         if len(v) < 4:
             raise ValueError("Username must be at least 4 characters")
@@ -1,5 +1,7 @@
+from functools import lru_cache
+
 from fastapi import FastAPI, Depends
-from pydantic import BaseModel, EmailStr
+from pydantic import BaseModel, ConfigDict, EmailStr
 
 app = FastAPI()
 
@@ -9,11 +11,14 @@ class UserSignUp(BaseModel):
     password: str
 
 class Settings(BaseModel):
+    model_config = ConfigDict(frozen=True)  # one instance is shared by all requests
+
     app_name: str = 'FastAPI App'
     admin_email: str = 'admin@app.com'
 
-def get_settings():
-    return Settings
+@lru_cache
+def get_settings() -> Settings:
+    return Settings()
 
 
 @app.post('/signup')
@@ -8,21 +8,24 @@ This example demonstrates:
 - Numeric value constraints
 - Optional fields with default values
 - Clear, descriptive schema metadata
+- Validating many rows at once with `TypeAdapter`
 
 Libraries:
 ----------
 pydantic.BaseModel
 pydantic.Field
+pydantic.TypeAdapter
 typing.Optional
 
 Official Documentation:
 ----------------------
 https://docs.pydantic.dev/usage/models/
 https://docs.pydantic.dev/usage/schema/
+https://docs.pydantic.dev/latest/concepts/type_adapter/
 """
 
 from typing import Optional
-from pydantic import BaseModel, Field, ValidationError
+from pydantic import BaseModel, Field, TypeAdapter, ValidationError
 
 
 class Employee(BaseModel):
@@ -72,6 +75,11 @@ class Employee(BaseModel):
     )
 
 
+# Validates a whole list of employees in ONE call.
+# Built once at module level — never inside a loop or per request.
+employee_list_adapter = TypeAdapter(list[Employee])
+
+
 # ==========================
 # INPUT DATA EXAMPLES
 # ==========================
@@ -140,3 +148,34 @@ except ValidationError as e:
     """
     print("\nValidation Error Occurred:")
     print(e)
+
+
+# ==========================
+# BATCH VALIDATION
+# ==========================
+
+employee_rows = [
+    {"id": 1, "name": "John Cena", "department": "HR", "salary": 50000},
+    {"id": "2", "name": "Alice", "salary": "25000"},
+    {"id": 3, "name": "Al", "salary": 20000},    # ❌ name too short
+]
+
+try:
+    # The loop over rows runs inside pydantic-core, not in Python
+    employees = employee_list_adapter.validate_python(employee_rows)
+    print("\nValidated Employees:")
+    print(employees)
+
+    # JSON input: parsing and validation happen in one step
+    # employees = employee_list_adapter.validate_json(raw_json_bytes)
+
+except ValidationError as e:
+    """
+    ValidationError:
+    ----------------
+    Raised when any row is invalid.
+    - Each error is prefixed with the row index (e.g. `2.name`)
+    - All invalid rows are reported together
+    """
+    print("\nBatch Validation Error Occurred:")
+    print(e)
@@ -1,29 +1,46 @@
 """
-Pydantic Model Configuration, Serialization & Custom JSON Encoding
-=================================================================
+Pydantic Model Serialization & Custom JSON Encoding
+==================================================
 
 This example demonstrates:
-- Model configuration using `ConfigDict` (Pydantic v2)
-- Custom JSON encoders for non-JSON-native types (`datetime`)
+- Custom JSON serialization for non-JSON-native types (`datetime`)
+  using `Annotated` + `PlainSerializer` (Pydantic v2)
 - Nested models and default values
 - Converting models to Python dicts and JSON strings
 
 Libraries:
 ----------
 pydantic.BaseModel
-pydantic.ConfigDict
+pydantic.PlainSerializer
 datetime.datetime
-typing.List
+typing.Annotated, typing.List
 
 Official Documentation:
 ----------------------
 https://docs.pydantic.dev/latest/concepts/serialization/
-https://docs.pydantic.dev/latest/concepts/models/#model-config
+https://docs.pydantic.dev/latest/concepts/serialization/#custom-serializers
 """
 
-from typing import List
+from typing import Annotated, List
 from datetime import datetime
-from pydantic import BaseModel, ConfigDict, ValidationError
+from pydantic import BaseModel, PlainSerializer, ValidationError
+
+
+# ======================================================
+# CUSTOM DATETIME TYPE
+# ======================================================
+
+# A datetime that is written as "DD-MM-YYYY HH:MM:SS" in JSON output.
+# - when_used="json" → model_dump() still returns a real datetime object
+# - Replaces the deprecated v1-style `json_encoders` config
+FormattedDatetime = Annotated[
+    datetime,
+    PlainSerializer(
+        lambda v: v.strftime('%d-%m-%Y %H:%M:%S'),
+        return_type=str,
+        when_used="json",
+    ),
+]
 
 
 # ======================================================
@@ -72,34 +89,25 @@ class User(BaseModel):
     is_active : bool, optional
         Account status (default: True)
 
-    createdAt : datetime
+    createdAt : FormattedDatetime
         Account creation timestamp
+        - Serialized as "DD-MM-YYYY HH:MM:SS" in JSON
 
     address : Address
         Nested Address model
 
     tags : List[str], optional
         User tags (default: empty list)
-
-    Model Configuration:
-    --------------------
-    - Custom JSON encoder for datetime objects
     """
 
     id: int
     name: str
     email: str
     is_active: bool = True
-    createdAt: datetime
+    createdAt: FormattedDatetime
     address: Address
     tags: List[str] = []
 
-    model_config = ConfigDict(
-        json_encoders={
-            datetime: lambda v: v.strftime('%d-%m-%Y %H:%M:%S')
-        }
-    )
-
 
 # ======================================================
 # MODEL INSTANTIATION
@@ -125,7 +133,9 @@ try:
     print("Python Dictionary Output:")
     print(python_dict)
 
-    # Convert model to JSON string (uses custom encoder)
+    # Convert model to JSON string (uses custom datetime serializer)
+    # - Serialized directly by pydantic-core, no intermediate dict
+    # - Prefer this over json.dumps(user.model_dump()) for API responses
     json_str = user.model_dump_json()
     print("\nJSON Output:")
     print(json_str)